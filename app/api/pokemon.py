@@ -1,9 +1,17 @@
-from typing import Any
+import hashlib
+from typing import Any, Iterable, TypeVar
 
-from flask import Blueprint, jsonify, request
+import orjson
+from flask import Blueprint, Response, jsonify, request
+from pydantic import BaseModel
+from sqlalchemy import ColumnElement, Text, cast, delete, exists, func, select
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, array
+from sqlalchemy.orm import Query, load_only
 
 from app.db import db
-from app.handlers.ingest_service import IngestService
+from app.handlers.cache import cache_get, cache_set, invalidate_read_cache, read_cache_key
+from app.handlers.config import settings
+from app.handlers.ingest_service import get_ingest_service
 from app.handlers.logger import logger
 from app.models.pokemon import Pokemon
 from app.schemas.pokemon import (
@@ -15,21 +23,132 @@ from app.schemas.pokemon import (
 
 pokemon_bp = Blueprint("pokemon", __name__, url_prefix="/pokemon")
 
+# Columns serialized in responses; list queries load only these
+_DETAIL_COLUMNS = [getattr(Pokemon, field) for field in PokemonDetail.model_fields]
+# Default and hard cap for the `limit` query param of list endpoints
+DEFAULT_LIMIT = 200
+MAX_LIMIT = 500
+# Rows fetched per batch while streaming list results into the response body
+_YIELD_PER = 100
 
-def _to_detail_dict(pokemon: Pokemon) -> dict:
+_Body = TypeVar("_Body", bound=BaseModel)
+
+
+def _parse_limit(default: int = DEFAULT_LIMIT, max_: int = MAX_LIMIT) -> int:
+    """
+    Parse the `limit` query param of list endpoints.
+
+    Missing, invalid or non-positive values fall back to the default; larger
+    values are capped so a single request cannot hydrate the whole table.
+
+    :param default: value used when `limit` is absent or invalid
+    :param max_: upper bound for `limit`
+
+    :return: The effective limit
+    """
+    value = request.args.get("limit", type=int)
+    if not value or value <= 0:
+        return default
+    return min(value, max_)
+
+
+def _parse_body(model: type[_Body]) -> _Body:
+    """
+    Validate the raw request body with the model's prebuilt validator.
+
+    The JSON bytes go straight to pydantic-core, skipping Flask's decode into an
+    intermediate dict. Contract:
+    - an empty body is treated as an empty object (all fields take their defaults);
+    - the body must otherwise be a JSON object: malformed JSON, `null` or any other
+      JSON value (array, string, number) is rejected with a validation error;
+    - the Content-Type header is not checked, so a JSON body sent as e.g. text/plain
+      is parsed like application/json instead of being ignored.
+
+    :param model: request schema to validate against
+
+    :return: The validated model instance
+    :raises ValidationError: on malformed JSON or an invalid body
+    """
+    return model.model_validate_json(request.get_data() or b"{}")
+
+
+def _json(payload: Any, status: int = 200) -> Response:
+    """
+    Build a JSON response serialized with orjson, bypassing Flask's jsonify.
+
+    :param payload: a JSON-compatible Python object
+    :param status: HTTP status code
+
+    :return: A Flask Response with application/json mimetype
+    """
+    return _raw_json(orjson.dumps(payload), status=status)
+
+
+def _raw_json(body: bytes | str, status: int = 200) -> Response:
+    """
+    Build a JSON response from an already serialized body.
+
+    :param body: JSON-encoded bytes or string
+    :param status: HTTP status code
+
+    :return: A Flask Response with application/json mimetype
+    """
+    return Response(body, status=status, mimetype="application/json")
+
+
+def _json_array(rows: Iterable[Pokemon]) -> bytes:
+    """
+    Serialize Pokemon rows into a JSON array by joining per-row orjson bytes,
+    so no intermediate list of dicts is materialized.
+
+    :param rows: Pokemon ORM instances (e.g. a query being iterated)
+
+    :return: JSON-encoded array bytes
+    """
+    return b"[" + b",".join(orjson.dumps(pokemon.to_dict()) for pokemon in rows) + b"]"
+
+
+def _cached_detail(key: str, query: Query) -> tuple[Any, int] | Response:
+    """
+    Serve a single Pokemon detail from the read cache, falling back to the
+    query on a miss and caching the serialized bytes (404s are not cached).
+
+    :param key: read-path cache key built with read_cache_key()
+    :param query: a Pokemon query selecting the wanted row
+
+    :return: PokemonDetail JSON response or 404
+    """
+    body = cache_get(key)
+    if body is None:
+        pokemon = query.options(load_only(*_DETAIL_COLUMNS)).first()
+        if not pokemon:
+            return jsonify({"error": "not_found"}), 404
+        body = orjson.dumps(pokemon.to_dict())
+        cache_set(key, body)
+
+    return _raw_json(body)
+
+
+def _types_match_any(types: list[str]) -> ColumnElement[bool]:
     """
-    Convert a Pokemon ORM instance to a full detail dictionary using the
-    PokemonDetail schema to ensure a consistent shape.
+    Build a SQL predicate matching Pokemon whose JSON `types` list contains
+    ANY of the given type names, so filtering runs in the database.
 
-    :param pokemon: a Pokemon ORM instance
+    PostgreSQL uses the JSONB `?|` operator; SQLite (JSON1) uses a correlated
+    EXISTS over json_each().
 
-    :return: A dict with full Pokemon details
+    :param types: normalized type names
+
+    :return: A boolean SQL expression usable in Query.filter()
     """
-    detail = PokemonDetail.model_validate(pokemon)
-    return detail.model_dump()
+    if db.engine.dialect.name == "postgresql":
+        return cast(Pokemon.types, JSONB).op("?|")(cast(array(types), ARRAY(Text)))
+
+    type_values = func.json_each(Pokemon.types).table_valued("value")
+    return exists(select(1).select_from(type_values).where(type_values.c.value.in_(types)))
 
 
-def add_pokemon() -> tuple[Any, int]:
+def add_pokemon() -> Response:
     """
     Add or update Pokemon by providing names in the request body.
 
@@ -37,34 +156,36 @@ def add_pokemon() -> tuple[Any, int]:
     """
     logger.info("Adding Pokemon...")
 
-    payload = request.get_json(silent=True) or {}
-    data = PokemonIngestRequest(**payload)
+    data = _parse_body(PokemonIngestRequest)
 
-    service = IngestService()
+    service = get_ingest_service()
 
     result_dict = service.ingest_many(data.names)
     result = IngestResult(**result_dict)
 
-    return jsonify(result.model_dump()), 202
+    return _raw_json(result.model_dump_json(), status=202)
 
 
 def list_pokemon() -> Any:
     """
-    List Pokemon resources with optional name filter and limit.
+    List Pokemon resources with an optional `limit` query param
+    (default 200, capped at 500).
 
     :return: A JSON array of full PokemonDetail objects
     """
     logger.info("Listing Pokemon...")
 
-    query = Pokemon.query
+    query = Pokemon.query.options(load_only(*_DETAIL_COLUMNS))
 
-    limit = request.args.get("limit", default=200, type=int)
-    if not isinstance(limit, int) or limit <= 0:
-        limit = 200
+    limit = _parse_limit()
 
-    items = [_to_detail_dict(pokemon) for pokemon in query.limit(limit).all()]
+    key = read_cache_key("list", limit)
+    body = cache_get(key)
+    if body is None:
+        body = _json_array(query.limit(limit).yield_per(_YIELD_PER))
+        cache_set(key, body)
 
-    return jsonify(items)
+    return _raw_json(body)
 
 
 def get_pokemon_by_id(pokemon_id: str) -> tuple[Any, int] | Any:
@@ -77,11 +198,7 @@ def get_pokemon_by_id(pokemon_id: str) -> tuple[Any, int] | Any:
     """
     logger.info("Retrieving Pokemon by ID...")
 
-    pokemon = Pokemon.query.filter_by(id=pokemon_id).first()
-    if not pokemon:
-        return jsonify({"error": "not_found"}), 404
-
-    return jsonify(_to_detail_dict(pokemon))
+    return _cached_detail(read_cache_key("id", pokemon_id), Pokemon.query.filter_by(id=pokemon_id))
 
 
 def get_pokemon_by_name(name: str) -> tuple[Any, int] | Any:
@@ -94,11 +211,8 @@ def get_pokemon_by_name(name: str) -> tuple[Any, int] | Any:
     """
     logger.info("Retrieving Pokemon by name...")
 
-    pokemon = Pokemon.query.filter_by(name=name.lower()).first()
-    if not pokemon:
-        return jsonify({"error": "not_found"}), 404
-
-    return jsonify(_to_detail_dict(pokemon))
+    name = name.lower()
+    return _cached_detail(read_cache_key("name", name), Pokemon.query.filter_by(name=name))
 
 
 def get_pokemon_by_pokedex(pokedex_number: int) -> tuple[Any, int] | Any:
@@ -111,42 +225,36 @@ def get_pokemon_by_pokedex(pokedex_number: int) -> tuple[Any, int] | Any:
     """
     logger.info("Retrieving Pokemon by Pokédex number...")
 
-    pokemon = Pokemon.query.filter_by(pokedex_number=int(pokedex_number)).first()
-    if not pokemon:
-        return jsonify({"error": "not_found"}), 404
-
-    return jsonify(_to_detail_dict(pokemon))
+    number = int(pokedex_number)
+    return _cached_detail(read_cache_key("pokedex", number), Pokemon.query.filter_by(pokedex_number=number))
 
 
 def list_pokemon_by_type() -> Any:
     """
-    List Pokemon that match ANY of the provided types.
+    List Pokemon that match ANY of the provided types, with an optional
+    `limit` query param (default 200, capped at 500).
 
     :return: A JSON array of full PokemonDetail objects matching any type
     """
     logger.info("Listing Pokemon by types...")
 
-    payload = request.get_json(silent=True) or {}
-    req = TypesFilterRequest(**payload)
+    req = _parse_body(TypesFilterRequest)
     if not req.types:
-        return jsonify([])
+        return _json([])
 
-    limit = request.args.get("limit", default=200, type=int)
-    if not isinstance(limit, int) or limit <= 0:
-        limit = 200
+    limit = _parse_limit()
 
-    wanted = set(req.types)
-    matches: list[Pokemon] = []
+    # Same type set + limit always yields the same body, whatever the request order
+    digest = hashlib.blake2b(orjson.dumps(sorted(req.types)) + str(limit).encode(), digest_size=16).hexdigest()
+    key = read_cache_key("by-type", digest)
+    body = cache_get(key)
+    if body is None:
+        query = Pokemon.query.options(load_only(*_DETAIL_COLUMNS))
+        matches = query.filter(_types_match_any(req.types)).limit(limit).yield_per(_YIELD_PER)
+        body = _json_array(matches)
+        cache_set(key, body, timeout=max(1, int(settings.STALE_TTL_MINUTES) * 60))
 
-    for pokemon in Pokemon.query.all():
-        pokemon_types = set(pokemon.types or [])
-        if pokemon_types.intersection(wanted):
-            matches.append(pokemon)
-            if len(matches) >= limit:
-                break
-    items = [_to_detail_dict(p) for p in matches]
-
-    return jsonify(items)
+    return _raw_json(body)
 
 
 def delete_pokemon(pokemon_id: str) -> tuple[Any, int]:
@@ -159,13 +267,14 @@ def delete_pokemon(pokemon_id: str) -> tuple[Any, int]:
     """
     logger.info("Deleting Pokemon...")
 
-    pokemon = Pokemon.query.filter_by(id=pokemon_id).first()
+    # Single DELETE statement; rowcount tells whether the row existed
+    result = db.session.execute(delete(Pokemon).where(Pokemon.id == pokemon_id))
+    db.session.commit()
 
-    if not pokemon:
+    if not result.rowcount:
         return jsonify({"error": "not_found"}), 404
 
-    db.session.delete(pokemon)
-    db.session.commit()
+    invalidate_read_cache()
     return "", 204
 
 
@@ -13,13 +13,23 @@ def read_pokemon_csv(default_path: str = "app/db/pokemon_list.csv") -> list[str]
     if not os.path.exists(default_path):
         return []
 
+    with open(default_path, encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    if not lines:
+        return []
+
+    # Plain split is enough for the seed file; only parse as CSV when fields are quoted
+    rows = csv.reader(lines) if any('"' in line for line in lines) else (line.split(",") for line in lines)
+    header = [h.strip() for h in next(rows)]
+    if "name" not in header:
+        return []
+    col = header.index("name")
+
     names: list[str] = []
-    with open(default_path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if not row:
-                continue
-            value = (row.get("name") or "").strip().lower()
-            if value:
-                names.append(value)
+    for row in rows:
+        if len(row) <= col:
+            continue
+        value = row[col].strip().lower()
+        if value:
+            names.append(value)
     return names
@@ -1,13 +1,19 @@
+import time
 from typing import Any
 
-from flask import Flask
+import orjson
+from flask import Flask, current_app
 from flask_caching import Cache
 
+from app.handlers.config import settings
 from app.handlers.logger import logger
 
 # Global cache instance (Flask-Caching)
 cache = Cache()
 
+# Version stamp embedded in every read-path key; bumping it invalidates them all
+READ_CACHE_VERSION_KEY = "pokemon:read-version"
+
 
 def init_cache(app: Flask) -> None:
     """
@@ -28,8 +34,9 @@ def init_cache(app: Flask) -> None:
 
     cache.init_app(app)
     logger.info(
-        f"Cache initialized "
-        f"(type={app.config["CACHE_TYPE"]}, default_timeout={app.config["CACHE_DEFAULT_TIMEOUT"]})"
+        "Cache initialized (type=%s, default_timeout=%s)",
+        app.config["CACHE_TYPE"],
+        app.config["CACHE_DEFAULT_TIMEOUT"],
     )
 
 
@@ -45,13 +52,13 @@ def cache_get(key: str) -> Any:
         val = cache.get(key)
     except Exception as e:
         # Cache likely not initialized in this context (e.g., tests). Treat as miss.
-        logger.error(f"cache error: {e}")
-        logger.debug(f"cache unavailable, treating as miss: {key}")
+        logger.error("cache error: %s", e)
+        logger.debug("cache unavailable, treating as miss: %s", key)
         return None
     if val is None:
-        logger.debug(f"cache miss: {key}")
+        logger.debug("cache miss: %s", key)
     else:
-        logger.debug(f"cache hit: {key}")
+        logger.debug("cache hit: %s", key)
     return val
 
 
@@ -67,8 +74,88 @@ def cache_set(key: str, value: Any, timeout: int | None = None) -> None:
     """
     try:
         cache.set(key, value, timeout=timeout)
-        logger.debug(f"cache set: {key} (timeout={timeout})")
+        logger.debug("cache set: %s (timeout=%s)", key, timeout)
     except Exception as e:
         # Cache not initialized
-        logger.error(f"cache error: {e}")
-        logger.debug(f"cache not initialized; skip set: {key}")
+        logger.error("cache error: %s", e)
+        logger.debug("cache not initialized; skip set: %s", key)
+
+
+def read_cache_key(*parts: Any) -> str:
+    """
+    Build a read-path cache key stamped with the current data version.
+
+    :param parts: key components (e.g. endpoint name and its arguments)
+
+    :return: cache key such as "pokemon:<version>:id:<uuid>"
+    """
+    version = cache_get(READ_CACHE_VERSION_KEY)
+    if version is None:
+        # Stamp expired or evicted: never fall back to a constant, which could match keys
+        # cached before an invalidation; seed a fresh stamp instead
+        stamp = time.time_ns()
+        try:
+            cache.add(READ_CACHE_VERSION_KEY, stamp, timeout=_read_cache_version_timeout())
+        except Exception as e:
+            logger.error("cache error: %s", e)
+        # Another worker may have seeded the stamp first; use whichever one was stored
+        version = cache_get(READ_CACHE_VERSION_KEY) or stamp
+    return ":".join(["pokemon", str(version), *(str(p) for p in parts)])
+
+
+def invalidate_read_cache() -> None:
+    """
+    Invalidate every cached read response by bumping the version stamp.
+
+    :return: None
+    """
+    cache_set(READ_CACHE_VERSION_KEY, time.time_ns(), timeout=_read_cache_version_timeout())
+
+
+def _read_cache_version_timeout() -> int:
+    """
+    TTL of the version stamp: at least as long as any read entry it stamps
+    (CACHE_DEFAULT_TIMEOUT or the by-type STALE_TTL_MINUTES), and never 0,
+    which SimpleCache prunes as already expired.
+
+    :return: timeout in seconds
+    """
+    default_timeout = int(current_app.config.get("CACHE_DEFAULT_TIMEOUT") or 0)
+    return max(default_timeout, int(settings.STALE_TTL_MINUTES) * 60, 1)
+
+
+def cache_get_json(key: str) -> Any:
+    """
+    Safe cache getter for values stored with cache_set_json().
+
+    :param key: cache key
+
+    :return: decoded value or None
+    """
+    raw = cache_get(key)
+    if raw is None:
+        return None
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError as e:
+        logger.error("cache decode error: %s", e)
+        return None
+
+
+def cache_set_json(key: str, value: Any, timeout: int | None = None) -> None:
+    """
+    Safe cache setter storing the value as orjson-encoded bytes, which is
+    compact and cheap to (de)serialize on any backend (no pickling).
+
+    :param key: cache key
+    :param value: JSON-compatible value to store
+    :param timeout: optional TTL in seconds (falls back to CACHE_DEFAULT_TIMEOUT)
+
+    :return: None
+    """
+    try:
+        encoded = orjson.dumps(value)
+    except TypeError as e:
+        logger.error("cache encode error: %s", e)
+        return
+    cache_set(key, encoded, timeout=timeout)
@@ -5,7 +5,8 @@ class Settings(BaseSettings):
     """
     Central application settings loaded from environment variables (.env).
 
-    All variables are REQUIRED (no defaults). If any is missing, a validation
+    All variables are REQUIRED (no defaults) except the opt-in debugging flags
+    below, which default to off. If a required one is missing, a validation
     error will be raised at access time when the singleton is first created.
 
     :return: None
@@ -29,6 +30,9 @@ class Settings(BaseSettings):
     CACHE_TYPE: str
     CACHE_DEFAULT_TIMEOUT: int
 
+    # Logging (optional): dump successful response bodies at DEBUG level
+    LOG_RESPONSE_BODIES: bool = False
+
     # Load from .env file at project root by default
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
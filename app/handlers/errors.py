@@ -21,7 +21,9 @@ def handle_validation_error(err: ValidationError) -> Tuple[Any, int]:
         jsonify(
             {
                 "error": "validation_error",
-                "details": err.errors(),
+                # Only type/loc/msg are reported: skips per-error docs URLs and context, and
+                # inputs are not echoed back since bodies are validated as raw JSON bytes
+                "details": err.errors(include_url=False, include_context=False, include_input=False),
             }
         ),
         400,
@@ -77,7 +79,7 @@ def handle_db_error(err: SQLAlchemyError) -> Tuple[Any, int]:
     try:
         db.session.rollback()
     except Exception as e:
-        logger.error(f"rollback error: {e}")
+        logger.error("rollback error: %s", e)
         pass
     return (
         jsonify(
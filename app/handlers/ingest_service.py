@@ -1,18 +1,58 @@
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from itertools import batched
 from typing import Any, Iterable
 
-from sqlalchemy import ColumnElement
+from flask import current_app, has_app_context
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from app.db import db
-from app.handlers.cache import cache_get, cache_set
+from app.handlers.cache import cache_get_json, cache_set_json, invalidate_read_cache
 from app.handlers.config import settings
 from app.handlers.logger import logger
 from app.handlers.pokeapi_client import (
+    MAX_CONCURRENT_REQUESTS,
     PokeAPIClient,
     PokemonNotFoundError,
 )
 from app.handlers.sanitizer import sanitize_pokemon_data
 from app.models.pokemon import Pokemon
+from app.schemas.pokemon import POKEMON_ALIASES, POKEMON_ALIASES_REVERSE
+
+_NORM_RE = re.compile(r"[^a-z0-9]+")
+
+# PokeAPI HTTP cache file, created in the Flask instance folder
+HTTP_CACHE_FILENAME = "pokeapi_http_cache.sqlite"
+
+# Bound-parameter limit per statement (SQLite's conservative default; PostgreSQL's protocol cap)
+_MAX_BIND_PARAMS = {"sqlite": 999, "postgresql": 65535}
+
+
+def _max_bind_params() -> int:
+    """
+    Return the bound-parameter cap of the current database dialect.
+
+    :return: The maximum number of parameters one statement may bind
+    """
+    return _MAX_BIND_PARAMS.get(db.engine.dialect.name, _MAX_BIND_PARAMS["sqlite"])
+
+
+@lru_cache(maxsize=4096)
+def _norm(name: str) -> str:
+    """
+    Normalize a Pokemon name to lowercase alphanumerics (cache key / alias form).
+
+    :param name: Pokemon name as provided
+
+    :return: The normalized name
+    """
+    return _NORM_RE.sub("", str(name).strip().lower())
 
 
 class IngestService:
@@ -20,17 +60,18 @@ class IngestService:
     Service responsible for fetching, transforming and persisting Pokemon data.
     """
 
-    def __init__(self, base_url: str | None = None) -> None:
+    def __init__(self, base_url: str | None = None, http_cache_path: str | None = None) -> None:
         """
         Initialize the ingestion service with a PokeAPI client.
 
         :param base_url: Optional PokeAPI base URL; defaults to app config
+        :param http_cache_path: Optional SQLite file for the client's HTTP cache (in-memory otherwise)
 
         :return: None
         """
         if base_url is None:
             base_url = settings.POKEAPI_BASE_URL
-        self.client = PokeAPIClient(str(base_url))
+        self.client = PokeAPIClient(str(base_url), cache_path=http_cache_path)
 
     def ingest_many(self, names: Iterable[str]) -> dict[str, Any]:
         """
@@ -42,86 +83,194 @@ class IngestService:
         """
         results: dict[str, Any] = {"ok": [], "not_found": [], "errors": []}
 
-        for name in names:
+        # Duplicates would otherwise cost one extra fetch each
+        names = list(dict.fromkeys(names))
+        db_names = [self._db_name(name) for name in names]
+
+        # DB-first: fresh rows are resolved by name only, without hydrating them
+        cutoff = datetime.now(UTC) - timedelta(minutes=int(settings.STALE_TTL_MINUTES))
+        fresh = self._select_fresh(db_names, cutoff)
+
+        # Cache-first for upstream payloads; misses are fetched concurrently
+        payloads: dict[str, Any] = {}
+        for name, db_name in zip(names, db_names):
+            if db_name not in fresh:
+                cached = cache_get_json(f"pokeapi:{_norm(name)}")
+                if cached is not None:
+                    payloads[name] = cached
+        to_fetch = [name for name, db_name in zip(names, db_names) if db_name not in fresh and name not in payloads]
+        fetched = self._fetch_many(to_fetch)
+
+        # Sanitized rows keyed by name, written with a single bulk upsert
+        rows: dict[str, dict[str, Any]] = {}
+
+        for name, db_name in zip(names, db_names):
             try:
                 # DB-first: if record exists and is not stale, skip upstream call
-                existing = Pokemon.query.filter_by(name=str(name).lower()).one_or_none()
-                if existing is not None and not self._is_stale(existing):
-                    logger.debug(f"db-first: fresh record, skipping fetch for {existing.name}")
-                    results["ok"].append(existing.name)
+                if db_name in fresh:
+                    logger.debug("db-first: fresh record, skipping fetch for %s", db_name)
+                    results["ok"].append(db_name)
                     continue
 
-                # Cache-first for upstream payload
-                norm = "".join(ch for ch in str(name).strip().lower() if ch.isalnum())
-                cache_key = f"pokeapi:{norm}"
-                raw = cache_get(cache_key)
+                raw = payloads.get(name)
                 if raw is None:
-                    raw = self.client.get_pokemon_by_name(name)
+                    outcome = fetched[name]
+                    if isinstance(outcome, BaseException):
+                        raise outcome
+                    raw = payloads[name] = outcome
                     # Use default cache timeout from settings
-                    cache_set(cache_key, raw, timeout=int(settings.CACHE_DEFAULT_TIMEOUT))
+                    cache_set_json(f"pokeapi:{_norm(name)}", raw, timeout=int(settings.CACHE_DEFAULT_TIMEOUT))
 
                 data = sanitize_pokemon_data(raw)
-                self._upsert(data)
+                rows[data["name"]] = self._to_row(data)
                 results["ok"].append(data["name"])
             except PokemonNotFoundError as e:
-                logger.error(f"Pokemon not found: {e}")
+                logger.error("Pokemon not found: %s", e)
                 results["not_found"].append(name)
             except Exception as e:
-                logger.error(f"Error ingesting Pokemon {name}: {e}")
+                logger.error("Error ingesting Pokemon %s: %s", name, e)
                 results["errors"].append({"name": name, "error": str(e)})
 
+        if rows:
+            self._upsert_many(list(rows.values()))
         db.session.commit()
+        if rows:
+            invalidate_read_cache()
         return results
 
+    def _fetch_many(self, names: list[str]) -> dict[str, dict[str, Any] | BaseException]:
+        """
+        Fetch many Pokemon from PokeAPI concurrently; HTTP calls release the
+        GIL, so a thread pool overlaps their round-trips.
+
+        :param names: unique Pokemon names to fetch
+
+        :return: Dict mapping each name to its raw payload or the raised exception
+        """
+        if not names:
+            return {}
+
+        # Bounded like a semaphore: never more in-flight requests than pooled connections
+        workers = min(len(names), MAX_CONCURRENT_REQUESTS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {name: executor.submit(self.client.get_pokemon_by_name, name) for name in names}
+
+        return {name: future.exception() or future.result() for name, future in futures.items()}
+
+    @staticmethod
+    def _db_name(name: str) -> str:
+        """
+        Resolve an input name to the name its row is stored under, applying
+        the same alias mapping the PokeAPI client uses.
+
+        :param name: Pokemon name as provided to ingest_many()
+
+        :return: The lowercase canonical name
+        """
+        # Stored slugs (e.g. scheduler refreshes of "mr-mime") are already canonical
+        if name in POKEMON_ALIASES_REVERSE:
+            return name
+        return POKEMON_ALIASES.get(_norm(name), str(name)).lower()
+
     @staticmethod
-    def _upsert(data: dict[str, Any]) -> None:
+    def _to_row(data: dict[str, Any]) -> dict[str, Any]:
         """
-        Create or update a Pokemon and its relations based on sanitized data.
+        Map sanitized data to the column values written by the bulk upsert.
 
         :param data: a dict produced by sanitize_pokemon_data()
 
-        :return: None
+        :return: A dict keyed by Pokemon column names
         """
-        p = Pokemon.query.filter_by(name=data["name"]).one_or_none()
-        if not p:
-            p = Pokemon()
-            p.pokedex_number = data["pokedex_number"]
-            p.name = data["name"]
+        return {
+            "name": data["name"],
+            "pokedex_number": data["pokedex_number"],
+            "height_m": data["height_m"],
+            "weight_kg": data["weight_kg"],
+            "base_experience": data.get("base_experience"),
+            "stats": data["stats"],
+            # JSON list fields
+            "types": list(data.get("types") or []),
+            "abilities": list(data.get("abilities") or []),
+            # Freshness timestamp
+            "refreshed_at": datetime.now(UTC),
+        }
 
-        # Update scalar fields
-        p.name = data["name"]
-        p.height_m = data["height_m"]
-        p.weight_kg = data["weight_kg"]
-        p.base_experience = data.get("base_experience")
-        p.stats = data["stats"]
-        p.pokedex_number = data["pokedex_number"]
+    @staticmethod
+    def _select_fresh(db_names: list[str], cutoff: datetime) -> set[str]:
+        """
+        Return the stored names among db_names refreshed at or after cutoff.
 
-        # JSON list fields
-        p.types = list(data.get("types") or [])
-        p.abilities = list(data.get("abilities") or [])
+        :param db_names: stored Pokemon names to look up
+        :param cutoff: oldest refreshed_at still considered fresh
 
-        # Update freshness timestamp
-        p.refreshed_at = datetime.now(UTC)
+        :return: The fresh names
+        """
+        # Every name binds one parameter in the IN list, plus one for the cutoff;
+        # stay under the driver's bound-parameter cap like the bulk upsert does
+        max_names = max(1, _max_bind_params() - 1)
 
-        db.session.add(p)
+        fresh: set[str] = set()
+        for chunk in batched(db_names, max_names):
+            stmt = select(Pokemon.name).where(Pokemon.name.in_(chunk), Pokemon.refreshed_at >= cutoff)
+            fresh.update(db.session.execute(stmt).scalars())
+        return fresh
 
     @staticmethod
-    def _is_stale(pokemon: Pokemon) -> bool | ColumnElement[bool]:
+    def _upsert_many(rows: list[dict[str, Any]]) -> None:
         """
-        Check if a Pokemon row is stale based on app configuration TTL.
+        Create or update many Pokemon in one INSERT ... ON CONFLICT (name) DO UPDATE.
 
-        :param pokemon: Pokemon ORM instance
+        :param rows: column value dicts produced by _to_row(), unique by name
 
-        :return: True if stale or never refreshed, False if fresh
+        :return: None
         """
-        minutes = int(settings.STALE_TTL_MINUTES)
-        refreshed = pokemon.refreshed_at
+        table = db.metadata.tables[Pokemon.__tablename__]
+        dialect = db.engine.dialect.name
+        insert = postgresql_insert if dialect == "postgresql" else sqlite_insert
 
-        if refreshed is None:
-            return True
+        # Every row binds one parameter per column; stay under the driver's bound-parameter cap
+        max_rows = max(1, _max_bind_params() // len(table.c) - 1)
 
-        if refreshed.tzinfo is None:
-            refreshed = refreshed.replace(tzinfo=UTC)
+        # Chunks run inside the caller's transaction, which commits once
+        for chunk in batched(rows, max_rows):
+            # Core statement on the table: no ORM identity-map or unit-of-work work per row
+            stmt = insert(table).values(list(chunk))
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.name],
+                # Existing rows keep their id; every other column takes the incoming value
+                set_={column.name: stmt.excluded[column.name] for column in table.c if column.name != "id"},
+            )
+            db.session.execute(stmt)
 
-        cutoff = datetime.now(UTC) - timedelta(minutes=minutes)
-        return refreshed < cutoff
+
+_default_service: IngestService | None = None
+_default_service_lock = threading.Lock()
+
+
+def get_ingest_service() -> IngestService:
+    """
+    Return the process-wide IngestService, creating it on first use so its
+    PokeAPI connection pool is reused across requests and scheduler runs.
+
+    The shared PokeAPIClient is safe to use from several threads (requests.Session).
+
+    :return: The shared IngestService instance
+    """
+    global _default_service
+    if _default_service is None:
+        with _default_service_lock:
+            if _default_service is None:
+                _default_service = IngestService(http_cache_path=_http_cache_path())
+    return _default_service
+
+
+def _http_cache_path() -> str | None:
+    """
+    Locate the PokeAPI HTTP cache file under the app's instance folder.
+
+    :return: The SQLite file path, or None outside an app context or when testing
+    """
+    if not has_app_context() or current_app.testing:
+        return None
+    os.makedirs(current_app.instance_path, exist_ok=True)
+    return os.path.join(current_app.instance_path, HTTP_CACHE_FILENAME)
@@ -0,0 +1,35 @@
+from typing import Any
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson, so jsonify() and request.get_json()
+    use the same Rust encoder/decoder as the cached read responses.
+
+    Types orjson does not handle natively fall back to Flask's default() hook.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serialize data as JSON; json.dumps-only options (indent, sort_keys...) are ignored.
+
+        :param obj: the data to serialize
+        :param kwargs: keyword arguments passed by Flask
+
+        :return: A JSON string
+        """
+        return orjson.dumps(obj, default=self.default).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """
+        Deserialize data as JSON.
+
+        :param s: text or UTF-8 bytes
+        :param kwargs: keyword arguments passed by Flask
+
+        :return: The decoded Python object
+        """
+        return orjson.loads(s)
@@ -2,7 +2,10 @@
 Basic logging, centralized so sinks/other logging necessities can be customized centrally
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 
 # Define ANSI escape codes for colors
 RESET = "\033[0m"
@@ -47,10 +50,18 @@ date_format = "%Y-%m-%d %H:%M:%S"
 console_handler = logging.StreamHandler()
 console_handler.setFormatter(CustomFormatter(log_format, datefmt=date_format))
 
+# Records are only enqueued on the caller's thread; a background listener does the stream I/O
+log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+queue_handler = logging.handlers.QueueHandler(log_queue)
+queue_listener = logging.handlers.QueueListener(log_queue, console_handler)
+queue_listener.start()
+# Flush pending records on interpreter exit
+atexit.register(queue_listener.stop)
+
 # Create the logger
 logger = logging.getLogger("logger")
 logger.setLevel(logging.DEBUG)
-logger.addHandler(console_handler)
+logger.addHandler(queue_handler)
 logger.propagate = False
 
 if __name__ == "__main__":
@@ -2,8 +2,12 @@ from typing import Any
 
 from flask import Flask, Response, request
 
+from app.handlers.config import settings
 from app.handlers.logger import logger
 
+# Path prefixes excluded from request/response logging (one C-level startswith per request)
+_SKIP_PATHS = ("/static/", "/health")
+
 
 def log_request_info() -> None:
     """
@@ -14,8 +18,9 @@ def log_request_info() -> None:
 
     :return: None
     """
-    if not request.path.startswith("/static/") and request.path != "/health":
-        logger.debug(f"{request.method} {request.path}")
+    path = request.path
+    if not path.startswith(_SKIP_PATHS):
+        logger.debug("%s %s", request.method, path)
 
 
 def log_response_info(response: Response) -> Any:
@@ -23,18 +28,24 @@ def log_response_info(response: Response) -> Any:
     Logs information about HTTP responses after they are processed.
 
     This function is executed after each request. It skips logging for responses
-    to static files or specific prefixes. For responses with status codes outside
-    the range of 200–399, it logs an error message.
+    to static files or specific prefixes. Successful responses (200–399) are logged
+    as a one-line summary; the body is also logged only when LOG_RESPONSE_BODIES is enabled. For responses with
+    status codes outside that range, it logs an error message.
 
     :param response: The HTTP response object to be logged and returned.
 
     :return: The same HTTP response object, unmodified.
     """
-    if not request.path.startswith("/static/") and request.path != "/health":
+    path = request.path
+    if not path.startswith(_SKIP_PATHS):
         if 200 <= response.status_code < 400:
-            logger.info(response.get_data(as_text=True))
+            logger.info("%s %s %s %sB", response.status_code, request.method, path, response.content_length)
+            # The logger always runs at DEBUG, so gate the body dump on a dedicated setting
+            # (off by default) to keep reading and decoding bodies off the normal request path
+            if settings.LOG_RESPONSE_BODIES:
+                logger.debug(response.get_data(as_text=True))
         else:
-            logger.error(f"{response.status_code} {request.method} {request.path}")
+            logger.error("%s %s %s", response.status_code, request.method, path)
 
     return response
 
@@ -1,11 +1,65 @@
+import re
+import sys
+from datetime import timedelta
+from functools import lru_cache
 from typing import Any
 
+import orjson
 import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
+from requests_cache.backends.sqlite import SQLiteCache
+from urllib3.util.retry import Retry
 
 from app.handlers.exceptions import PokeAPIError, PokemonNotFoundError
 from app.handlers.logger import logger
 from app.schemas.pokemon import POKEMON_ALIASES
 
+_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+# Fallback freshness for cached PokeAPI responses without Cache-Control headers
+HTTP_CACHE_EXPIRE_AFTER = timedelta(days=1)
+
+# Upper bound of in-flight requests to PokeAPI; also sizes the connection pool
+MAX_CONCURRENT_REQUESTS = 20
+
+
+@lru_cache(maxsize=2048)
+def _canonicalize(raw: str) -> str:
+    """
+    Resolve a user-provided name to the PokeAPI slug via the alias map.
+
+    Cached because the scheduler and the startup sync keep resolving the same names.
+
+    :param raw: stripped Pokemon name as provided by the user
+
+    :return: The canonical PokeAPI name, or the input when it has no alias
+    """
+    return POKEMON_ALIASES.get(sys.intern(_ALNUM_RE.sub("", raw.lower())), raw)
+
+
+class _LockedSQLiteCache(SQLiteCache):
+    """
+    SQLite HTTP cache safe for the ingest thread pool.
+
+    requests-cache serializes writes with a lock but runs reads on one shared
+    connection without it, which SQLite rejects ("bad parameter or other API
+    misuse") under concurrent fetches; reads take the same lock here. Only cache
+    access is serialized, the HTTP round-trips still overlap.
+    """
+
+    def get_response(self, key: str, default: Any = None) -> Any:
+        with self.responses._lock:
+            return super().get_response(key, default)
+
+    def save_response(self, *args: Any, **kwargs: Any) -> None:
+        with self.responses._lock:
+            super().save_response(*args, **kwargs)
+
+    def delete(self, *args: Any, **kwargs: Any) -> None:
+        with self.responses._lock:
+            super().delete(*args, **kwargs)
+
 
 class PokeAPIClient:
     """
@@ -13,17 +67,43 @@ class PokeAPIClient:
     alias inputs to canonical PokeAPI slugs before requesting.
     """
 
-    def __init__(self, base_url: str, timeout_s: float = 10.0) -> None:
+    def __init__(self, base_url: str, timeout_s: float = 10.0, cache_path: str | None = None) -> None:
         """
         Initialize the client with a base URL and timeout.
 
         :param base_url: Base URL for PokeAPI
         :param timeout_s: Request timeout in seconds
+        :param cache_path: SQLite file for the HTTP cache; in-memory when omitted (e.g. tests)
 
         :return: None
         """
         self.base_url = base_url.rstrip("/")
         self.timeout_s = float(timeout_s)
+        # HTTP cache honoring Cache-Control/ETag (PokeAPI resources are effectively immutable),
+        # on top of pooled keep-alive connections sized for concurrent fetches from IngestService.
+        # Kept on disk so cached responses don't accumulate in process memory.
+        self._session = requests_cache.CachedSession(
+            backend=_LockedSQLiteCache(cache_path) if cache_path else "memory",
+            expire_after=HTTP_CACHE_EXPIRE_AFTER,
+            cache_control=True,
+        )
+        # Transient upstream failures are retried with backoff; the last response is still returned
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)
+        adapter = HTTPAdapter(
+            pool_connections=MAX_CONCURRENT_REQUESTS,
+            pool_maxsize=MAX_CONCURRENT_REQUESTS,
+            max_retries=retries,
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    def purge_expired_cache(self) -> None:
+        """
+        Delete expired responses from the HTTP cache (the backend never does it on its own).
+
+        :return: None
+        """
+        self._session.cache.delete(expired=True)
 
     def get_pokemon_by_name(self, name: str) -> dict[str, Any]:
         """
@@ -39,10 +119,7 @@ class PokeAPIClient:
         :return: Raw JSON payload as a dictionary
         :raises: PokemonNotFoundError if not found; PokeAPIError for other errors
         """
-        raw = str(name or "").strip()
-
-        normalized = "".join(ch for ch in raw.lower() if ch.isalnum())
-        name = POKEMON_ALIASES.get(normalized, raw)
+        name = _canonicalize(str(name or "").strip())
         data = self._try_fetch(name)
         if data is None:
             raise PokemonNotFoundError(
@@ -62,13 +139,17 @@ class PokeAPIClient:
         """
         url = f"{self.base_url}/pokemon/{name}"
         try:
-            resp = requests.get(url, timeout=self.timeout_s)
+            resp = self._session.get(url, timeout=self.timeout_s)
         except requests.RequestException as e:
-            logger.error(f"request error: {e}")
+            logger.error("request error: %s", e)
             raise PokeAPIError(f"network error: {e}") from e
+        except Exception as e:
+            # HTTP cache backend failures (e.g. SQLite errors) must surface like any other upstream error
+            logger.error("http cache error: %s", e)
+            raise PokeAPIError(f"http cache error: {e}") from e
 
         if resp.status_code == 404:
             return None
         if not resp.ok:
             raise PokeAPIError(f"status {resp.status_code}: {resp.text}")
-        return resp.json()
+        return orjson.loads(resp.content)
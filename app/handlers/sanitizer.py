@@ -1,7 +1,17 @@
+import sys
+from operator import itemgetter
 from typing import Any
 
 from app.schemas.pokemon import STAT_KEYS
 
+# Zeroed stats built once; copied per Pokemon instead of rebuilt with a comprehension
+_STATS_TEMPLATE: dict[str, int] = dict.fromkeys(STAT_KEYS, 0)
+
+# Key lookups bound once and driven by map(), for the per-slot type/ability lists
+_type_of = itemgetter("type")
+_ability_of = itemgetter("ability")
+_name_of = itemgetter("name")
+
 
 def _extract_stats(raw_stats: list[dict[str, Any]]) -> dict[str, int]:
     """
@@ -11,11 +21,11 @@ def _extract_stats(raw_stats: list[dict[str, Any]]) -> dict[str, int]:
 
     :return: dict with canonical stat keys and integer values
     """
-    stats: dict[str, int] = {k: 0 for k in STAT_KEYS}
+    stats = _STATS_TEMPLATE.copy()
     for item in raw_stats or []:
         name = (item.get("stat") or {}).get("name")
         base = int(item.get("base_stat", 0) or 0)
-        if name in STAT_KEYS:
+        if isinstance(name, str) and sys.intern(name) in STAT_KEYS:
             stats[name] = base
     return stats
 
@@ -29,8 +39,8 @@ def sanitize_pokemon_data(raw: dict[str, Any]) -> dict[str, Any]:
     :return: A normalized dict
     """
     name = str(raw.get("name", "")).lower()
-    types = [t["type"]["name"].lower() for t in (raw.get("types") or [])]
-    abilities = [a["ability"]["name"].lower() for a in (raw.get("abilities") or [])]
+    types = [_name_of(t).lower() for t in map(_type_of, raw.get("types") or ())]
+    abilities = [_name_of(a).lower() for a in map(_ability_of, raw.get("abilities") or ())]
 
     pokedex_id = raw.get("id")
     if pokedex_id is None:
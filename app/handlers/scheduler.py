@@ -3,10 +3,11 @@ from typing import List
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from flask import Flask
-from sqlalchemy import or_
+from sqlalchemy import or_, select
 
+from app.db import db
 from app.handlers.config import settings
-from app.handlers.ingest_service import IngestService
+from app.handlers.ingest_service import get_ingest_service
 from app.handlers.logger import logger
 from app.models.pokemon import Pokemon
 
@@ -23,13 +24,14 @@ def _select_stale_names(app: Flask) -> List[str]:
         minutes = int(settings.STALE_TTL_MINUTES)
         batch = int(settings.REFRESH_BATCH_SIZE)
         threshold = datetime.now(UTC) - timedelta(minutes=minutes)
-        q = (
-            Pokemon.query.filter(or_(Pokemon.refreshed_at.is_(None), Pokemon.refreshed_at < threshold))
+        # Only the name column is selected; rows are never hydrated into Pokemon objects
+        stmt = (
+            select(Pokemon.name)
+            .where(or_(Pokemon.refreshed_at.is_(None), Pokemon.refreshed_at < threshold))
             .order_by(Pokemon.refreshed_at.is_(None).desc(), Pokemon.refreshed_at.asc())
             .limit(batch)
         )
-        names = [p.name for p in q.all()]
-        return names
+        return list(db.session.execute(stmt).scalars())
 
 
 def refresh_stale_job(app: Flask) -> None:
@@ -42,13 +44,17 @@ def refresh_stale_job(app: Flask) -> None:
     :return: None
     """
     try:
+        # Expired PokeAPI HTTP cache entries are only dropped here, once per tick
+        with app.app_context():
+            get_ingest_service().client.purge_expired_cache()
+
         names = _select_stale_names(app)
         if not names:
             logger.debug("scheduler: no stale Pokemon to refresh")
             return
-        logger.info(f"scheduler: refreshing {len(names)} stale Pokemon...")
+        logger.info("scheduler: refreshing %s stale Pokemon...", len(names))
         with app.app_context():
-            service = IngestService()
+            service = get_ingest_service()
             result = service.ingest_many(names)
             logger.info(
                 "scheduler: refresh done ok=%s not_found=%s errors=%s",
@@ -57,7 +63,7 @@ def refresh_stale_job(app: Flask) -> None:
                 len(result.get("errors", [])),
             )
     except Exception as e:  # pragma: no cover - defensive logging only
-        logger.error(f"scheduler error: {e}")
+        logger.error("scheduler error: %s", e)
 
 
 def start_scheduler(app: Flask) -> None:
@@ -96,4 +102,4 @@ def start_scheduler(app: Flask) -> None:
     if not hasattr(app, "extensions"):
         app.extensions = {}
     app.extensions["apscheduler"] = scheduler
-    logger.info(f"scheduler: started (interval={interval}m)")
+    logger.info("scheduler: started (interval=%sm)", interval)
@@ -6,6 +6,7 @@ from app.db import init_db
 from app.handlers.cache import init_cache
 from app.handlers.config import settings
 from app.handlers.errors import register_error_handlers
+from app.handlers.json_provider import OrjsonProvider
 from app.handlers.logger import logger
 from app.handlers.middlewares import register_middlewares
 from app.handlers.scheduler import start_scheduler
@@ -32,22 +33,22 @@ def sync_on_start(app_: Flask) -> None:
 
         # Lazy imports to avoid circular dependencies and only load when needed
         from app.db.config import read_pokemon_csv
-        from app.handlers.ingest_service import IngestService
+        from app.handlers.ingest_service import get_ingest_service
 
         with app_.app_context():
             names = read_pokemon_csv()
             if not names:
                 logger.info("No seed CSV entries found; skipping initial sync.")
                 return
-            logger.info(f"Starting initial sync for {len(names)} Pokemon from CSV...")
-            service = IngestService()
+            logger.info("Starting initial sync for %s Pokemon from CSV...", len(names))
+            service = get_ingest_service()
             result = service.ingest_many(names)
             ok = len(result.get("ok", []))
             not_found = len(result.get("not_found", []))
             errors = len(result.get("errors", []))
-            logger.info(f"Initial sync done. ok={ok} not_found={not_found} errors={errors}")
+            logger.info("Initial sync done. ok=%s not_found=%s errors=%s", ok, not_found, errors)
     except Exception as e:  # pragma: no cover - safety net for startup
-        logger.warning(f"Initial sync failed (boot continues): {e}")
+        logger.warning("Initial sync failed (boot continues): %s", e)
 
 
 def create_app() -> Flask:
@@ -58,6 +59,8 @@ def create_app() -> Flask:
     :raises: None
     """
     app_ = Flask(__name__)
+    # jsonify()/get_json() through orjson, like the serialized read responses
+    app_.json = OrjsonProvider(app_)
 
     # Reflect settings into app.config so existing components continue to work
     app_.config["SQLALCHEMY_DATABASE_URI"] = settings.SQLALCHEMY_DATABASE_URI
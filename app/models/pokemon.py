@@ -1,7 +1,8 @@
 import uuid
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import DateTime, Float, Integer, String
+from sqlalchemy import DateTime, Float, Index, Integer, String
 from sqlalchemy.dialects.sqlite import JSON as SQLITE_JSON
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -24,6 +25,10 @@ class Pokemon(db.Model):
     """
 
     __tablename__ = "pokemon"
+    __table_args__ = (
+        # Covers the ingest freshness check (name IN ... AND refreshed_at >= cutoff) without table lookups
+        Index("ix_pokemon_name_refreshed_at", "name", "refreshed_at"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     name: Mapped[str] = mapped_column(String(80), unique=True, index=True, nullable=False)
@@ -37,4 +42,25 @@ class Pokemon(db.Model):
     abilities: Mapped[list[str]] = mapped_column(SQLITE_JSON, nullable=False, default=list)
 
     # Last time this row was refreshed from PokeAPI (UTC)
-    refreshed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    refreshed_at: Mapped[datetime | None] = mapped_column(DateTime, index=True, nullable=True)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Build the public detail representation straight from the loaded columns.
+
+        Rows are validated on the way in, so no schema pass is needed on the way out.
+        The keys mirror the PokemonDetail schema.
+
+        :return: A JSON-compatible dict with full Pokemon details
+        """
+        return {
+            "id": self.id,
+            "name": self.name,
+            "pokedex_number": self.pokedex_number,
+            "height_m": self.height_m,
+            "weight_kg": self.weight_kg,
+            "base_experience": self.base_experience,
+            "stats": self.stats,
+            "types": self.types,
+            "abilities": self.abilities,
+        }
@@ -1,34 +1,77 @@
+import string
+import sys
+from types import MappingProxyType
 from typing import Any, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_serializer
 
+# ASCII lowercasing + symbol stripping for names in one C-level str.translate() pass.
+# Built from character ranges (a few hundred bytes, not one entry per code point): gender
+# symbols fold to letters ("NIDORAN♀" -> "nidoranf") and typographic apostrophes
+# ("Farfetch’d") are dropped, so common names never take the Unicode fallback.
+_NAME_TABLE: dict[int, int | None] = str.maketrans(
+    string.ascii_uppercase + "♀♂",
+    string.ascii_lowercase + "fm",
+    "".join(ch for ch in map(chr, range(128)) if not ch.isalnum()) + "’‘",
+)
 
-class PokemonIngestRequest(BaseModel):
-    """Request body schema for ingesting Pokemon names."""
 
-    names: list[str] = Field(default_factory=list, description="list of Pokemon names")
+def _strip_symbols(name: str) -> str:
+    """
+    Lowercase a name and remove every non-alphanumeric character.
+
+    :param name: a Pokemon name as provided
+
+    :return: The normalized name (may be empty)
+    """
+    s = name.translate(_NAME_TABLE)
+    # Only non-ASCII leftovers need the per-character Unicode fallback
+    if not s.isascii():
+        s = "".join(ch for ch in s.lower() if ch.isalnum())
+    return s
+
+
+def _trim_lower(value: str) -> str:
+    """
+    Trim surrounding whitespace and lowercase a value.
+
+    :param value: a string as provided
+
+    :return: The normalized value (may be empty)
+    """
+    return value.strip().lower()
+
+
+def _make_validator(*, strip_symbols: bool) -> Any:
+    """
+    Build the normalization validator shared by the request schemas: every entry is
+    lowercased, and empty entries and duplicates are removed preserving order.
+
+    The per-entry normalizer is chosen once here and bound in the closure, so each
+    validation call does no flag checks or global lookups.
+
+    :param strip_symbols: remove every non-alphanumeric character (otherwise only trim whitespace)
+
+    :return: A classmethod to wrap with field_validator()
+    """
+    normalize = _strip_symbols if strip_symbols else _trim_lower
+
+    def _validate(cls: type[BaseModel], v: list[str]) -> list[str]:
+        # Entries are already str: the list[str] schema validates them before this runs.
+        # Duplicates would otherwise each cost an upstream fetch or a redundant filter term;
+        # dict.fromkeys() drops them preserving order without a Python-level seen-set loop
+        return list(dict.fromkeys(s for s in map(normalize, v) if s))
+
+    return classmethod(_validate)
 
-    @field_validator("names")
-    @classmethod
-    def _normalize(cls, v: list[str]) -> list[str]:
-        """
-        Normalize names to the required input rule: lowercase and no symbols.
 
-        All non-alphanumeric characters are removed and the string is lowercased.
+class PokemonIngestRequest(BaseModel):
+    """Request body schema for ingesting Pokemon names."""
 
-        :param v: a list of strings
+    names: list[str] = Field(default_factory=list, description="list of Pokemon names")
 
-        :return: Normalized list (lowercase, alphanumeric only), empty entries removed
-        """
-        norm: list[str] = []
-        for x in v:
-            s = str(x).strip().lower()
-            # Map gender symbols before stripping non-alphanumerics
-            s = s.replace("♀", "f").replace("♂", "m")
-            s = "".join(ch for ch in s if ch.isalnum())
-            if s:
-                norm.append(s)
-        return norm
+    # Required input rule: lowercase and no symbols ("Mr. Mime" -> "mrmime"), each name once
+    _normalize = field_validator("names")(_make_validator(strip_symbols=True))
 
 
 class PokemonSummary(BaseModel):
@@ -37,7 +80,32 @@ class PokemonSummary(BaseModel):
     id: str
     name: str
     pokedex_number: int
-    types: list[str] = Field(default_factory=list)
+    types: tuple[str, ...] = ()
+
+
+class PokemonStats(BaseModel):
+    """
+    Fixed-shape base stats of a Pokemon.
+
+    Fields use the PokeAPI stat names (e.g. "special-attack") as aliases, which is
+    also how stats are stored and served; populate_by_name allows the Python names too.
+    Dumps always use the aliases, so nesting models serialize the wire format.
+    """
+
+    hp: int
+    attack: int
+    defense: int
+    special_attack: int = Field(alias="special-attack")
+    special_defense: int = Field(alias="special-defense")
+    speed: int
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    @model_serializer(mode="plain")
+    def _dump_by_alias(self) -> dict[str, int]:
+        # pydantic 2.9 has no serialize_by_alias config, and a parent's model_dump() would
+        # otherwise emit "special_attack" unless every caller remembers by_alias=True
+        return {key: getattr(self, name) for name, key in _STAT_FIELDS}
 
 
 class PokemonDetail(BaseModel):
@@ -49,9 +117,9 @@ class PokemonDetail(BaseModel):
     height_m: float
     weight_kg: float
     base_experience: Optional[int] = None
-    stats: dict[str, int]
-    types: list[str]
-    abilities: list[str]
+    stats: PokemonStats
+    types: tuple[str, ...]
+    abilities: tuple[str, ...]
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -59,9 +127,9 @@ class PokemonDetail(BaseModel):
 class IngestResult(BaseModel):
     """Result summary for an ingestion run."""
 
-    ok: list[str] = Field(default_factory=list)
-    not_found: list[str] = Field(default_factory=list)
-    errors: list[dict[str, Any]] = Field(default_factory=list)
+    ok: tuple[str, ...] = ()
+    not_found: tuple[str, ...] = ()
+    errors: tuple[dict[str, Any], ...] = ()
 
 
 class TypesFilterRequest(BaseModel):
@@ -74,43 +142,23 @@ class TypesFilterRequest(BaseModel):
 
     types: list[str] = Field(default_factory=list, description="list of type names to match (union)")
 
-    @field_validator("types")
-    @classmethod
-    def _normalize_types(cls, v: list[str]) -> list[str]:
-        """
-        Normalize type names by trimming and lowercasing; remove empty entries and duplicates preserving order.
-
-        :param v: a list of strings
-
-        :return: Normalized list of unique, lowercased type names
-        :raises: None
-        """
-        seen: set[str] = set()
-        out: list[str] = []
-        for x in v:
-            s = str(x).strip().lower()
-            if not s:
-                continue
-            if s in seen:
-                continue
-            seen.add(s)
-            out.append(s)
-        return out
-
-
-STAT_KEYS = {
-    "hp",
-    "attack",
-    "defense",
-    "special-attack",
-    "special-defense",
-    "speed",
-}
+    # Type names are trimmed and lowercased, each type once
+    _normalize_types = field_validator("types")(_make_validator(strip_symbols=False))
+
+
+# (attribute, PokeAPI stat name) pairs in declaration order, used by PokemonStats dumps
+_STAT_FIELDS: tuple[tuple[str, str], ...] = tuple(
+    (name, field.alias or name) for name, field in PokemonStats.model_fields.items()
+)
+
+# PokeAPI stat names kept by the sanitizer, derived from the PokemonStats aliases;
+# interned so membership checks against interned payload names match by identity
+STAT_KEYS: frozenset[str] = frozenset(sys.intern(key) for _, key in _STAT_FIELDS)
 
 # Known aliases mapping from user-required normalized input
 # (lowercase, no spaces/hyphens/punctuation) to the canonical PokeAPI
 # (may include hyphens and mixed-case when required by upstream).
-POKEMON_ALIASES: dict[str, str] = {
+_ALIASES: dict[str, str] = {
     "nidoranf": "nidoran-f",
     "nidoranm": "nidoran-m",
     "drowzee": "Drowzee",
@@ -188,3 +236,15 @@ POKEMON_ALIASES: dict[str, str] = {
     "ironboulder": "iron-boulder",
     "ironcrown": "iron-crown",
 }
+
+# Frozen at import; keys and values are interned so lookups with interned names
+# (see pokeapi_client._canonicalize) compare by identity first
+POKEMON_ALIASES: MappingProxyType[str, str] = MappingProxyType(
+    {sys.intern(k): sys.intern(v) for k, v in _ALIASES.items()}
+)
+
+# Reverse lookup: lowercase stored slug (e.g. "mr-mime") -> normalized alias key ("mrmime"),
+# for code paths that already hold a canonical name and must not re-normalize it
+POKEMON_ALIASES_REVERSE: MappingProxyType[str, str] = MappingProxyType(
+    {v.lower(): k for k, v in POKEMON_ALIASES.items()}
+)
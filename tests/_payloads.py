@@ -0,0 +1,52 @@
+"""
+Raw PokeAPI payloads shared by the test modules.
+"""
+
+from typing import Any
+
+
+def raw_payload(
+    name: str,
+    poke_id: int,
+    types: tuple[str, ...] = ("grass", "poison"),
+    abilities: tuple[str, ...] = ("overgrow",),
+    height: int = 10,
+) -> dict[str, Any]:
+    """
+    Build a minimal raw payload shaped like PokeAPI's pokemon resource, as the sanitizer expects.
+
+    :param name: canonical name returned by PokeAPI
+    :param poke_id: national dex id
+    :param types: type names
+    :param abilities: ability names
+    :param height: height in decimetres
+
+    :return: dict in PokeAPI format
+    :raises: None
+    """
+    return {
+        "name": name,
+        "id": poke_id,
+        "height": height,
+        "weight": 100,
+        "base_experience": 64,
+        "stats": [
+            {"base_stat": 45, "stat": {"name": "hp"}},
+            {"base_stat": 49, "stat": {"name": "attack"}},
+            {"base_stat": 49, "stat": {"name": "defense"}},
+            {"base_stat": 65, "stat": {"name": "special-attack"}},
+            {"base_stat": 65, "stat": {"name": "special-defense"}},
+            {"base_stat": 45, "stat": {"name": "speed"}},
+        ],
+        "types": [{"type": {"name": t}} for t in types],
+        "abilities": [{"ability": {"name": a}} for a in abilities],
+    }
+
+
+# Built once at import and shared by every fake client, so treat them as read-only:
+# tests needing a variant build their own with raw_payload()
+PAYLOADS: dict[str, dict[str, Any]] = {
+    "pikachu": raw_payload("pikachu", 25, ("electric",), ("static",)),
+    "swampert": raw_payload("swampert", 260, ("water", "ground"), ("torrent",)),
+    "bulbasaur": raw_payload("bulbasaur", 1),
+}
@@ -15,28 +15,33 @@ from typing import Any, Generator  # noqa: E402
 
 import pytest  # noqa: E402
 from flask import Flask  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
 
 from app.api.health import health_bp  # noqa: E402
 from app.api.pokemon import pokemon_bp  # noqa: E402
 from app.db import db, init_db  # noqa: E402
+from app.handlers.cache import cache, init_cache  # noqa: E402
 from app.handlers.errors import register_error_handlers  # noqa: E402
+from app.handlers.json_provider import OrjsonProvider  # noqa: E402
 from app.handlers.middlewares import register_middlewares  # noqa: E402
 
 
-@pytest.fixture()
-def app(tmp_path) -> Generator[Flask, Any, None]:
+@pytest.fixture(scope="session")
+def app() -> Generator[Flask, Any, None]:
     """
-    Create a Flask app instance configured for testing with an isolated SQLite DB.
-
-    :param tmp_path: pytest-provided temporary directory path fixture
+    Create the Flask app instance shared by the whole test session, backed by
+    an in-memory SQLite database whose schema init_db() creates once.
 
     :return: A configured Flask application instance for tests
     :raises: None
     """
     flask_app = Flask(__name__)
+    flask_app.json = OrjsonProvider(flask_app)
     flask_app.config.update(
         TESTING=True,
-        SQLALCHEMY_DATABASE_URI="sqlite:///test-default.db",
+        # One in-memory database shared by every connection: no file I/O in tests
+        SQLALCHEMY_DATABASE_URI="sqlite:///:memory:",
+        SQLALCHEMY_ENGINE_OPTIONS={"connect_args": {"check_same_thread": False}, "poolclass": StaticPool},
         SQLALCHEMY_TRACK_MODIFICATIONS=False,
         POKEAPI_BASE_URL="https://pokeapi.co/api/v2",
     )
@@ -66,19 +71,45 @@ def client(app: Flask):
         yield app.test_client()
 
 
+@pytest.fixture()
+def read_cache(app: Flask, monkeypatch: pytest.MonkeyPatch):
+    """
+    Back the shared cache with a fresh SimpleCache for one test, so read responses
+    are actually cached (the session default is NullCache).
+
+    :param app: The Flask test application
+    :param monkeypatch: pytest monkeypatch, which restores the previous cache afterwards
+
+    :return: The Flask-Caching cache instance
+    :raises: None
+    """
+    # The app is shared by the session: scope the cache to this test
+    monkeypatch.setitem(app.config, "CACHE_TYPE", "SimpleCache")
+    monkeypatch.setitem(app.extensions, "cache", {})
+    init_cache(app)
+    return cache
+
+
 @pytest.fixture(autouse=True)
-def _clean_db(app: Flask) -> Generator[None, None, None]:
+def _clean_db(request: pytest.FixtureRequest) -> Generator[None, None, None]:
     """
-    Ensure a clean database state per test by truncating all tables.
+    Ensure a clean database state after each test marked with `db` by deleting all rows.
+
+    The schema is created once per session; only rows are removed here, which
+    avoids re-running the DDL for every test. Unmarked tests skip the cleanup.
 
-    :param app: The Flask application
+    :param request: pytest fixture request of the running test
 
     :return: None
     :raises: None
     """
-    # Before test: nothing to do (DB was just created)
+    if request.node.get_closest_marker("db") is None:
+        yield
+        return
+
+    app: Flask = request.getfixturevalue("app")
     yield
-    # After test: drop all and recreate for isolation
     with app.app_context():
-        db.drop_all()
-        db.create_all()
+        for table in reversed(db.metadata.sorted_tables):
+            db.session.execute(table.delete())
+        db.session.commit()
@@ -1,38 +1,12 @@
-from typing import Any
+import pytest
+from sqlalchemy import update
 
+from app.db import db
 from app.models.pokemon import Pokemon
+from tests._payloads import PAYLOADS
 
 
-def _raw_payload(name: str, poke_id: int, types: list[str] | None = None) -> dict[str, Any]:
-    """
-    Build a minimal raw payload aligned with what sanitizer expects.
-
-    :param name: canonical name returned by PokeAPI
-    :param poke_id: national dex id
-    :param types: optional list of type names
-
-    :return: dict in PokeAPI format
-    :raises: None
-    """
-    return {
-        "name": name,
-        "id": poke_id,
-        "height": 10,
-        "weight": 100,
-        "base_experience": 64,
-        "stats": [
-            {"base_stat": 10, "stat": {"name": "hp"}},
-            {"base_stat": 20, "stat": {"name": "attack"}},
-            {"base_stat": 30, "stat": {"name": "defense"}},
-            {"base_stat": 40, "stat": {"name": "special-attack"}},
-            {"base_stat": 50, "stat": {"name": "special-defense"}},
-            {"base_stat": 60, "stat": {"name": "speed"}},
-        ],
-        "types": [{"type": {"name": t}} for t in (types or ["electric"])],
-        "abilities": [{"ability": {"name": "static"}}],
-    }
-
-
+@pytest.mark.db
 def test_add_and_list_and_get_delete_flow(app, client, monkeypatch) -> None:
     """
     Full flow: add via POST /add-pokemon, list via GET /pokemon, get by id and name, then delete.
@@ -47,12 +21,8 @@ def test_add_and_list_and_get_delete_flow(app, client, monkeypatch) -> None:
 
     # Patch upstream client to return controlled payloads
     def fake_get(name: str):  # type: ignore[no-redef]
-        mapping = {
-            "pikachu": _raw_payload("pikachu", 25, ["electric"]),
-            "bulbasaur": _raw_payload("bulbasaur", 1, ["grass", "poison"]),
-        }
-        if name in mapping:
-            return mapping[name]
+        if name in PAYLOADS:
+            return PAYLOADS[name]
         from app.handlers.pokeapi_client import PokemonNotFoundError
 
         raise PokemonNotFoundError(name)
@@ -132,8 +102,40 @@ def test_validation_error_returns_400(client) -> None:
     assert resp.status_code == 400
     body = resp.get_json()
     assert body["error"] == "validation_error"
+    assert set(body["details"][0]) == {"type", "loc", "msg"}
+
+    # malformed JSON is rejected by the same handler
+    resp = client.post("/pokemon", data=b"{not json", content_type="application/json")
+    assert resp.status_code == 400
+    assert resp.get_json()["error"] == "validation_error"
+
+
+def test_parse_body_contract(client) -> None:
+    """
+    Ensure request bodies must be JSON objects and are parsed regardless of Content-Type.
+
+    :param client: Flask client
+
+    :return: None
+    :raises: None
+    """
+    # null and non-object JSON bodies are validation errors, not empty bodies
+    for raw in (b"null", b'["pikachu"]'):
+        resp = client.post("/pokemon", data=raw, content_type="application/json")
+        assert resp.status_code == 400
+        assert resp.get_json()["error"] == "validation_error"
+
+    # the Content-Type header is not checked: a text/plain JSON body is still validated...
+    resp = client.post("/pokemon", data=b'{"names": "pikachu"}', content_type="text/plain")
+    assert resp.status_code == 400
+
+    # ...and accepted when valid
+    resp = client.post("/pokemon", data=b'{"names": []}', content_type="text/plain")
+    assert resp.status_code == 202
+    assert resp.get_json() == {"ok": [], "not_found": [], "errors": []}
 
 
+@pytest.mark.db
 def test_list_by_type_union(app, client, monkeypatch) -> None:
     """
     Verify that POST /pokemon/by-type returns union of matches.
@@ -148,13 +150,8 @@ def test_list_by_type_union(app, client, monkeypatch) -> None:
 
     # Patch upstream client to return controlled payloads
     def fake_get(name: str):  # type: ignore[no-redef]
-        mapping = {
-            "pikachu": _raw_payload("pikachu", 25, ["electric"]),
-            "swampert": _raw_payload("swampert", 260, ["water", "ground"]),
-            "bulbasaur": _raw_payload("bulbasaur", 1, ["grass", "poison"]),
-        }
-        if name in mapping:
-            return mapping[name]
+        if name in PAYLOADS:
+            return PAYLOADS[name]
         from app.handlers.pokeapi_client import PokemonNotFoundError
 
         raise PokemonNotFoundError(name)
@@ -171,7 +168,7 @@ def test_list_by_type_union(app, client, monkeypatch) -> None:
     resp = client.post("/pokemon/by-type", json={"types": ["water"]})
     assert resp.status_code == 200
     names = sorted([x["name"] for x in resp.get_json()])
-    assert "swampert" in names
+    assert names == ["swampert"]
 
     # Filter by 'ground' also returns swampert
     resp = client.post("/pokemon/by-type", json={"types": ["ground"]})
@@ -184,3 +181,97 @@ def test_list_by_type_union(app, client, monkeypatch) -> None:
     assert resp.status_code == 200
     names = sorted([x["name"] for x in resp.get_json()])
     assert "swampert" in names
+
+    # Union across different Pokemon honors the limit query param
+    resp = client.post("/pokemon/by-type?limit=1", json={"types": ["electric", "grass"]})
+    assert resp.status_code == 200
+    assert len(resp.get_json()) == 1
+
+
+@pytest.mark.db
+def test_read_cache_invalidated_on_delete(client, read_cache, monkeypatch) -> None:
+    """
+    Verify that cached read responses are served until a delete invalidates them.
+
+    :param client: Flask client fixture
+    :param read_cache: per-test SimpleCache fixture
+    :param monkeypatch: pytest monkeypatch
+
+    :return: None
+    :raises: None
+    """
+    import app.handlers.pokeapi_client as client_mod
+
+    monkeypatch.setattr(client_mod.PokeAPIClient, "get_pokemon_by_name", staticmethod(lambda name: PAYLOADS["pikachu"]))
+
+    resp = client.post("/pokemon", json={"names": ["pikachu"]})
+    assert resp.status_code == 202
+
+    resp = client.get("/pokemon/name/pikachu")
+    assert resp.status_code == 200
+    pokemon_id = resp.get_json()["id"]
+
+    # Second read is served from the cache: a row change made behind the cache's back is not seen
+    db.session.execute(update(Pokemon).values(height_m=99.0))
+    db.session.commit()
+    resp = client.get("/pokemon/name/pikachu")
+    assert resp.get_json()["id"] == pokemon_id
+    assert resp.get_json()["height_m"] == 1.0
+
+    resp = client.delete(f"/pokemon/{pokemon_id}")
+    assert resp.status_code == 204
+
+    resp = client.get("/pokemon/name/pikachu")
+    assert resp.status_code == 404
+
+
+@pytest.mark.db
+def test_read_cache_survives_lost_version_stamp(client, read_cache, monkeypatch) -> None:
+    """
+    Verify that losing the read-cache version stamp (expiry or eviction) never
+    brings back bodies cached under an older version.
+
+    :param client: Flask client fixture
+    :param read_cache: per-test SimpleCache fixture
+    :param monkeypatch: pytest monkeypatch
+
+    :return: None
+    :raises: None
+    """
+    import app.handlers.pokeapi_client as client_mod
+    from app.handlers.cache import READ_CACHE_VERSION_KEY
+
+    monkeypatch.setattr(client_mod.PokeAPIClient, "get_pokemon_by_name", staticmethod(lambda name: PAYLOADS[name]))
+
+    assert client.post("/pokemon", json={"names": ["bulbasaur"]}).status_code == 202
+    read_cache.delete(READ_CACHE_VERSION_KEY)
+    assert [p["name"] for p in client.get("/pokemon").get_json()] == ["bulbasaur"]
+
+    assert client.post("/pokemon", json={"names": ["pikachu"]}).status_code == 202
+    assert sorted(p["name"] for p in client.get("/pokemon").get_json()) == ["bulbasaur", "pikachu"]
+
+    # A new stamp is seeded instead of reusing a version the stale list was cached under
+    read_cache.delete(READ_CACHE_VERSION_KEY)
+    assert sorted(p["name"] for p in client.get("/pokemon").get_json()) == ["bulbasaur", "pikachu"]
+
+
+def test_parse_limit_defaults_and_cap(app) -> None:
+    """
+    Verify that the list `limit` param falls back to the default when invalid and is capped.
+
+    :param app: Flask app fixture
+
+    :return: None
+    :raises: None
+    """
+    from app.api.pokemon import DEFAULT_LIMIT, MAX_LIMIT, _parse_limit
+
+    for query, expected in [
+        ("", DEFAULT_LIMIT),
+        ("?limit=abc", DEFAULT_LIMIT),
+        ("?limit=-3", DEFAULT_LIMIT),
+        ("?limit=30", 30),
+        ("?limit=1000000", MAX_LIMIT),
+    ]:
+        with app.test_request_context(f"/pokemon{query}"):
+            assert _parse_limit() == expected
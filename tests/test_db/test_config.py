@@ -0,0 +1,21 @@
+from app.db.config import read_pokemon_csv
+
+
+def test_read_pokemon_csv_reads_name_column(tmp_path) -> None:
+    """
+    Ensure the seed reader returns lowercase names from the `name` column, skipping blanks.
+
+    :param tmp_path: pytest-provided temporary directory path fixture
+
+    :return: None
+    :raises: None
+    """
+    plain = tmp_path / "plain.csv"
+    plain.write_text("name\nPikachu\n\n  Charizard \n", encoding="utf-8")
+    assert read_pokemon_csv(str(plain)) == ["pikachu", "charizard"]
+
+    quoted = tmp_path / "quoted.csv"
+    quoted.write_text('id,name\n1,"Mr. Mime"\n2,bulbasaur\n', encoding="utf-8")
+    assert read_pokemon_csv(str(quoted)) == ["mr. mime", "bulbasaur"]
+
+    assert read_pokemon_csv(str(tmp_path / "missing.csv")) == []
@@ -1,39 +1,19 @@
-from typing import Any
+import io
 
+import orjson
+import pytest
+from requests.adapters import HTTPAdapter
+from sqlalchemy import event
+from urllib3 import HTTPResponse
+
+from app.db import db
 from app.handlers.ingest_service import IngestService
 from app.handlers.pokeapi_client import PokemonNotFoundError
 from app.models.pokemon import Pokemon
+from tests._payloads import PAYLOADS, raw_payload
 
 
-def _raw_payload(name: str, poke_id: int) -> dict[str, Any]:
-    """
-    Build a minimal raw payload similar to PokeAPI response for tests.
-
-    :param name: Pokemon name (canonical)
-    :param poke_id: National Pokédex ID
-
-    :return: A dict shaped like PokeAPI's pokemon resource
-    :raises: None
-    """
-    return {
-        "name": name,
-        "id": poke_id,
-        "height": 10,
-        "weight": 100,
-        "base_experience": 64,
-        "stats": [
-            {"base_stat": 45, "stat": {"name": "hp"}},
-            {"base_stat": 49, "stat": {"name": "attack"}},
-            {"base_stat": 49, "stat": {"name": "defense"}},
-            {"base_stat": 65, "stat": {"name": "special-attack"}},
-            {"base_stat": 65, "stat": {"name": "special-defense"}},
-            {"base_stat": 45, "stat": {"name": "speed"}},
-        ],
-        "types": [{"type": {"name": "grass"}}, {"type": {"name": "poison"}}],
-        "abilities": [{"ability": {"name": "overgrow"}}],
-    }
-
-
+@pytest.mark.db
 def test_ingest_service_upsert_and_summary(monkeypatch, app) -> None:
     """
     Verify that IngestService ingests valid names, reports not_found, and persists rows.
@@ -47,7 +27,7 @@ def test_ingest_service_upsert_and_summary(monkeypatch, app) -> None:
 
     def fake_get(name: str):  # type: ignore[no-redef]
         if name == "bulbasaur":
-            return _raw_payload("bulbasaur", 1)
+            return PAYLOADS["bulbasaur"]
         raise PokemonNotFoundError(name)
 
     # Patch the PokeAPI client method used by the service
@@ -74,3 +54,186 @@ def test_ingest_service_upsert_and_summary(monkeypatch, app) -> None:
         assert p.stats["hp"] == 45
         assert "grass" in p.types and "poison" in p.types
         assert "overgrow" in p.abilities
+
+
+@pytest.mark.db
+def test_ingest_service_skips_fresh_rows(monkeypatch, app) -> None:
+    """
+    Verify that duplicate names are fetched once and that a second ingest reuses fresh rows
+    without calling PokeAPI again.
+
+    :param monkeypatch: pytest monkeypatch fixture
+    :param app: Flask test app
+
+    :return: None
+    :raises: None
+    """
+    calls: list[str] = []
+
+    def fake_get(name: str):  # type: ignore[no-redef]
+        calls.append(name)
+        return PAYLOADS["bulbasaur"]
+
+    import app.handlers.pokeapi_client as client_mod
+
+    monkeypatch.setattr(client_mod.PokeAPIClient, "get_pokemon_by_name", staticmethod(fake_get))
+
+    service = IngestService(base_url="https://example.com/api/v2")
+    with app.app_context():
+        service.ingest_many(["bulbasaur", "bulbasaur"])
+        result = service.ingest_many(["bulbasaur"])
+
+    assert result["ok"] == ["bulbasaur"]
+    assert calls == ["bulbasaur"]
+
+
+@pytest.mark.db
+def test_ingest_service_refresh_updates_rows_in_place(monkeypatch, app) -> None:
+    """
+    Verify that re-ingesting stale rows updates them in place (same id) via the bulk upsert.
+
+    :param monkeypatch: pytest monkeypatch fixture
+    :param app: Flask test app
+
+    :return: None
+    :raises: None
+    """
+    heights = {"bulbasaur": 10, "ivysaur": 10}
+
+    def fake_get(name: str):  # type: ignore[no-redef]
+        return raw_payload(name, 1 if name == "bulbasaur" else 2, height=heights[name])
+
+    import app.handlers.pokeapi_client as client_mod
+    from app.handlers.config import settings
+
+    monkeypatch.setattr(client_mod.PokeAPIClient, "get_pokemon_by_name", staticmethod(fake_get))
+
+    service = IngestService(base_url="https://example.com/api/v2")
+    with app.app_context():
+        service.ingest_many(["bulbasaur", "ivysaur"])
+        ids = {p.name: p.id for p in Pokemon.query.all()}
+        assert len(set(ids.values())) == 2
+
+        # Every row is stale with a zero TTL, so both are fetched and updated again
+        monkeypatch.setattr(settings, "STALE_TTL_MINUTES", 0)
+        heights["bulbasaur"] = 20
+        result = service.ingest_many(["bulbasaur", "ivysaur"])
+
+        assert result["ok"] == ["bulbasaur", "ivysaur"]
+        rows = {p.name: p for p in Pokemon.query.all()}
+        assert {name: p.id for name, p in rows.items()} == ids
+        assert rows["bulbasaur"].height_m == 2.0
+
+
+@pytest.mark.db
+def test_ingest_service_chunks_bulk_upsert(monkeypatch, app) -> None:
+    """
+    Verify that the bulk upsert is split into several statements when rows exceed the bound-parameter cap.
+
+    :param monkeypatch: pytest monkeypatch fixture
+    :param app: Flask test app
+
+    :return: None
+    :raises: None
+    """
+    dex = {"bulbasaur": 1, "ivysaur": 2, "venusaur": 3}
+
+    def fake_get(name: str):  # type: ignore[no-redef]
+        return raw_payload(name, dex[name])
+
+    import app.handlers.ingest_service as service_mod
+    import app.handlers.pokeapi_client as client_mod
+
+    monkeypatch.setattr(client_mod.PokeAPIClient, "get_pokemon_by_name", staticmethod(fake_get))
+    # Room for a single row per statement
+    monkeypatch.setitem(service_mod._MAX_BIND_PARAMS, "sqlite", 25)
+
+    service = IngestService(base_url="https://example.com/api/v2")
+    with app.app_context():
+        result = service.ingest_many(list(dex))
+        assert result["ok"] == list(dex)
+        assert sorted(p.pokedex_number for p in Pokemon.query.all()) == [1, 2, 3]
+
+
+class _FakePokeAPIAdapter(HTTPAdapter):
+    """Transport adapter answering every /pokemon/<name> request locally, below the HTTP cache."""
+
+    def send(self, request, **kwargs):  # type: ignore[override]
+        name = request.url.rsplit("/", 1)[-1]
+        raw = HTTPResponse(
+            body=io.BytesIO(orjson.dumps({"name": name, "id": 1})),
+            status=200,
+            headers={"Content-Type": "application/json"},
+            preload_content=False,
+            request_url=request.url,
+        )
+        return self.build_response(request, raw)
+
+
+def test_fetch_many_with_sqlite_http_cache_is_thread_safe(tmp_path) -> None:
+    """
+    Ensure concurrent fetches sharing one SQLite-backed HTTP cache neither fail
+    nor get reported as errors, both when filling the cache and when reading it.
+
+    :param tmp_path: pytest-provided temporary directory path fixture
+
+    :return: None
+    :raises: None
+    """
+    service = IngestService(base_url="https://example.com/api/v2", http_cache_path=str(tmp_path / "http.sqlite"))
+    service.client._session.mount("https://", _FakePokeAPIAdapter())
+    names = [f"pokemon{i}" for i in range(60)]
+
+    for _ in range(3):
+        fetched = service._fetch_many(names)
+        assert {name: payload["name"] for name, payload in fetched.items()} == {name: name for name in names}
+
+    assert len(service.client._session.cache.responses) == len(names)
+
+
+@pytest.mark.db
+def test_ingest_service_chunks_freshness_query(monkeypatch, app) -> None:
+    """
+    Verify that the DB-first freshness lookup is split into several IN queries when
+    names exceed the bound-parameter cap, and still finds every fresh row.
+
+    :param monkeypatch: pytest monkeypatch fixture
+    :param app: Flask test app
+
+    :return: None
+    :raises: None
+    """
+    dex = {"bulbasaur": 1, "ivysaur": 2, "venusaur": 3}
+    fetched: list[str] = []
+
+    def fake_get(name: str):  # type: ignore[no-redef]
+        fetched.append(name)
+        return raw_payload(name, dex[name])
+
+    import app.handlers.ingest_service as service_mod
+    import app.handlers.pokeapi_client as client_mod
+
+    monkeypatch.setattr(client_mod.PokeAPIClient, "get_pokemon_by_name", staticmethod(fake_get))
+
+    service = IngestService(base_url="https://example.com/api/v2")
+    with app.app_context():
+        service.ingest_many(list(dex))
+        fetched.clear()
+
+        # Room for the cutoff and a single name per statement
+        monkeypatch.setitem(service_mod._MAX_BIND_PARAMS, "sqlite", 2)
+        selects: list[str] = []
+
+        def count_selects(conn, cursor, statement, parameters, context, executemany) -> None:
+            if statement.lstrip().upper().startswith("SELECT"):
+                selects.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", count_selects)
+        try:
+            result = service.ingest_many(list(dex))
+        finally:
+            event.remove(db.engine, "before_cursor_execute", count_selects)
+
+        assert result["ok"] == list(dex)
+        assert fetched == []
+        assert len(selects) == len(dex)
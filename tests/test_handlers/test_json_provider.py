@@ -0,0 +1,23 @@
+from datetime import UTC, datetime
+
+from flask import Flask, jsonify
+
+from app.handlers.json_provider import OrjsonProvider
+
+
+def test_orjson_provider_roundtrip() -> None:
+    """
+    Ensure jsonify() and the provider's loads() go through orjson and still
+    handle Flask's extra types (e.g. datetimes) and non-ASCII text.
+
+    :return: None
+    :raises: None
+    """
+    flask_app = Flask(__name__)
+    flask_app.json = OrjsonProvider(flask_app)
+
+    with flask_app.app_context():
+        resp = jsonify({"name": "flabébé", "at": datetime(2024, 1, 2, tzinfo=UTC)})
+
+    assert resp.mimetype == "application/json"
+    assert flask_app.json.loads(resp.get_data()) == {"name": "flabébé", "at": "2024-01-02T00:00:00+00:00"}
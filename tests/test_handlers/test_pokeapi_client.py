@@ -1,6 +1,9 @@
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
+import orjson
 import pytest
+from requests_cache import CachedResponse
 
 from app.handlers.pokeapi_client import PokeAPIClient, PokemonNotFoundError
 
@@ -9,16 +12,21 @@ class DummyResp:
     def __init__(self, status_code: int, json_data: dict[str, Any] | None = None, text: str = "") -> None:
         self.status_code = status_code
         self._json = json_data or {}
+        self.content = orjson.dumps(self._json)
         self.text = text
-
-    @property
-    def ok(self) -> bool:
-        return 200 <= self.status_code < 300
+        self.ok = 200 <= status_code < 300
 
     def json(self) -> dict[str, Any]:
         return self._json
 
 
+# Responses are never mutated by the client, so each fake_get returns a shared instance
+_RESP_MRMIME = DummyResp(
+    200, {"name": "mr-mime", "id": 122, "height": 13, "weight": 545, "stats": [], "types": [], "abilities": []}
+)
+_RESP_404 = DummyResp(404)
+
+
 def test_alias_mapping_mrmime(monkeypatch) -> None:
     """
     Ensure alias 'mrmime' resolves to 'mr-mime' and performs the request on that name.
@@ -32,15 +40,10 @@ def test_alias_mapping_mrmime(monkeypatch) -> None:
 
     def fake_get(url: str, timeout: float):  # type: ignore[no-redef]
         called["url"] = url
-        return DummyResp(
-            200, {"name": "mr-mime", "id": 122, "height": 13, "weight": 545, "stats": [], "types": [], "abilities": []}
-        )
-
-    import requests
-
-    monkeypatch.setattr(requests, "get", fake_get)
+        return _RESP_MRMIME
 
     client = PokeAPIClient(base_url="https://example.com/api/v2")
+    monkeypatch.setattr(client._session, "get", fake_get)
     data = client.get_pokemon_by_name("mrmime")
     assert data["name"] == "mr-mime"
     assert called["url"] == "https://example.com/api/v2/pokemon/mr-mime"
@@ -57,12 +60,32 @@ def test_not_found_raises(monkeypatch) -> None:
     """
 
     def fake_get(url: str, timeout: float):  # type: ignore[no-redef]
-        return DummyResp(404)
-
-    import requests
-
-    monkeypatch.setattr(requests, "get", fake_get)
+        return _RESP_404
 
     client = PokeAPIClient(base_url="https://example.com/api/v2")
+    monkeypatch.setattr(client._session, "get", fake_get)
     with pytest.raises(PokemonNotFoundError):
         client.get_pokemon_by_name("doesnotexist")
+
+
+def test_http_cache_on_disk_and_purged(tmp_path) -> None:
+    """
+    Ensure a cache path puts the HTTP cache in SQLite at that path, and that
+    purging removes expired responses.
+
+    :param tmp_path: pytest-provided temporary directory path fixture
+
+    :return: None
+    :raises: None
+    """
+    cache_path = tmp_path / "http_cache.sqlite"
+    client = PokeAPIClient(base_url="https://example.com/api/v2", cache_path=str(cache_path))
+    assert client._session.cache.responses.db_path == cache_path
+
+    cache = client._session.cache
+    expired = CachedResponse(status_code=200, url="https://example.com/api/v2/pokemon/old", content=b"{}")
+    cache.save_response(expired, cache_key="old", expires=datetime.now(UTC) - timedelta(seconds=1))
+    assert len(cache.responses) == 1
+
+    client.purge_expired_cache()
+    assert len(cache.responses) == 0
@@ -1,4 +1,5 @@
 from app.handlers.sanitizer import sanitize_pokemon_data
+from app.schemas.pokemon import PokemonStats
 
 
 def test_sanitize_pokemon_data_transforms_units_and_lists() -> None:
@@ -39,3 +40,29 @@ def test_sanitize_pokemon_data_transforms_units_and_lists() -> None:
     assert data["stats"]["hp"] == 35
     assert data["types"] == ["electric"]
     assert data["abilities"] == ["static", "lightning-rod"]
+
+
+def test_sanitized_stats_match_pokemon_stats_schema() -> None:
+    """
+    Ensure sanitized stats fill every PokemonStats field and keep the
+    hyphenated PokeAPI names when dumped by alias.
+
+    :return: None
+    :raises: None
+    """
+    raw = {
+        "name": "Mr-Mime",
+        "id": 122,
+        "stats": [
+            {"base_stat": 40, "stat": {"name": "hp"}},
+            {"base_stat": 100, "stat": {"name": "special-attack"}},
+            {"base_stat": 7, "stat": {"name": "unknown-stat"}},
+        ],
+    }
+
+    stats = sanitize_pokemon_data(raw)["stats"]
+    model = PokemonStats.model_validate(stats)
+    assert model.hp == 40
+    assert model.special_attack == 100
+    assert model.speed == 0
+    assert model.model_dump(by_alias=True) == stats
@@ -1,4 +1,10 @@
-from app.schemas.pokemon import PokemonIngestRequest
+from app.schemas.pokemon import (
+    POKEMON_ALIASES,
+    POKEMON_ALIASES_REVERSE,
+    PokemonDetail,
+    PokemonIngestRequest,
+    PokemonStats,
+)
 
 
 def test_ingest_request_normalizes_names() -> None:
@@ -16,12 +22,14 @@ def test_ingest_request_normalizes_names() -> None:
             "Farfetch’d",
             "tapu-koko",
             "mewtwo",
+            "FLABÉBÉ",
+            "PIKACHU",
             "",
             "   ",
         ]
     }
     req = PokemonIngestRequest(**body)
-    # empty/blank entries removed; symbols stripped; lowercase applied
+    # empty/blank entries and duplicates removed; symbols stripped; lowercase applied
     assert req.names == [
         "pikachu",
         "mrmime",
@@ -29,4 +37,42 @@ def test_ingest_request_normalizes_names() -> None:
         "farfetchd",
         "tapukoko",
         "mewtwo",
+        "flabébé",
     ]
+
+
+def test_alias_reverse_lookup_inverts_aliases() -> None:
+    """
+    Ensure every canonical slug maps back to the normalized alias it came from.
+
+    :return: None
+    :raises: None
+    """
+    assert POKEMON_ALIASES_REVERSE["mr-mime"] == "mrmime"
+    assert POKEMON_ALIASES_REVERSE["mewtwo"] == "mewtwo"
+    for slug, alias in POKEMON_ALIASES_REVERSE.items():
+        assert POKEMON_ALIASES[alias].lower() == slug
+
+
+def test_pokemon_detail_dumps_stats_by_alias() -> None:
+    """
+    Ensure nested stats serialize with the PokeAPI stat names, not the Python field names.
+
+    :return: None
+    :raises: None
+    """
+    stats = {"hp": 45, "attack": 49, "defense": 49, "special-attack": 65, "special-defense": 65, "speed": 45}
+    detail = PokemonDetail(
+        id="1",
+        name="bulbasaur",
+        pokedex_number=1,
+        height_m=0.7,
+        weight_kg=6.9,
+        stats=PokemonStats(**stats),
+        types=("grass", "poison"),
+        abilities=("overgrow",),
+    )
+    dumped = detail.model_dump_json()
+    assert '"special-attack":65' in dumped
+    assert "special_attack" not in dumped
+    assert detail.model_dump()["stats"] == stats